@@ -6,14 +6,23 @@ A Flask web app that allows users to upload images via phone and get specimen co
 
 import os
 import sys
-import subprocess
 import shutil
 import zipfile
 import glob
+import threading
+import cv2
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from flask import Flask, request, render_template, redirect, url_for, send_file, flash, jsonify, session
 from werkzeug.utils import secure_filename
+from ultralytics import YOLO
+from run_count_specimens_with_counts import (
+    count_image, create_output_structure, find_images, get_inference_params,
+    select_device,
+)
+# Aliased: the /process view below is also called process_images
+from run_count_specimens_with_counts import process_images as count_batch
 
 app = Flask(__name__)
 app.secret_key = 'yolo_specimen_counter_secret_key_2025'  # Change this in production
@@ -43,6 +52,51 @@ def get_available_models():
         models.insert(0, fallback)
     return [str(path) for path in models]
 
+
+# Loaded models, keyed by path. When preloading (see wsgi.py) they are loaded
+# and warmed before the server forks, so the predictor's fused copy of the
+# weights - the one inference actually runs on - is shared copy-on-write.
+_models = {}
+_models_lock = threading.Lock()
+# YOLO predictors keep per-call state, so inference on a model is serialised
+_inference_locks = {}
+
+
+def get_model(model_path):
+    """Return the loaded model for a path, loading it on first use"""
+    with _models_lock:
+        if model_path not in _models:
+            _models[model_path] = YOLO(model_path)
+            _inference_locks[model_path] = threading.Lock()
+        return _models[model_path], _inference_locks[model_path]
+
+def warm_model(model_path):
+    """
+    Load a model and run one blank image through it. The first predict sets
+    up the predictor (a fused copy of the weights), so doing it here keeps
+    that cost out of the first real request.
+    """
+    model, inference_lock = get_model(model_path)
+    with inference_lock:
+        if model.predictor is None:
+            blank = np.zeros((640, 640, 3), np.uint8)
+            model.predict(blank, **get_inference_params(select_device()))
+    return model
+
+def preload_models():
+    """Load and warm every model in the zoo; returns the paths loaded"""
+    model_paths = get_available_models()
+    for model_path in model_paths:
+        warm_model(model_path)
+    return model_paths
+
+def resolve_model(model_path):
+    """Fall back to the default model if the path is missing or not in the zoo"""
+    available_models = get_available_models()
+    if model_path in available_models:
+        return model_path
+    return available_models[0] if available_models else ''
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and \
@@ -161,36 +215,65 @@ def process_images():
 def run_yolo():
     """Run the YOLO processing script"""
     try:
-        model_path = session.get('selected_model') or ''
-        available_models = get_available_models()
-        if not model_path and available_models:
-            model_path = available_models[0]
-        if model_path and model_path not in available_models:
-            model_path = available_models[0] if available_models else ''
+        model_path = resolve_model(session.get('selected_model') or '')
 
         if not model_path:
             return jsonify({'status': 'error', 'message': 'No model available. Add .pt files to model_zoo/.'})
 
-        # Run the existing YOLO script
-        result = subprocess.run([
-            '/usr/local/bin/python',
-            'run_count_specimens_with_counts.py',
-            '--model-path',
-            model_path
-        ], 
-        capture_output=True, 
-        text=True, 
-        cwd='/home/appuser/yolo'
-        )
-        
-        if result.returncode == 0:
-            return jsonify({'status': 'success', 'message': 'Processing completed'})
-        else:
-            return jsonify({'status': 'error', 'message': f'Processing failed: {result.stderr}'})
+        image_files = find_images(UPLOAD_FOLDER)
+        if not image_files:
+            return jsonify({'status': 'error', 'message': 'Processing failed: no uploaded images found'})
+
+        # Run the counting pipeline in-process on the shared model
+        model, inference_lock = get_model(model_path)
+        output_dir = create_output_structure(RESULTS_FOLDER)
+        with inference_lock:
+            count_batch(model, image_files, output_dir, get_inference_params(select_device()))
+
+        return jsonify({'status': 'success', 'message': 'Processing completed'})
     
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Error running YOLO: {str(e)}'})
 
+@app.route('/api/count', methods=['POST'])
+def api_count():
+    """Count specimens in a single uploaded image and return JSON"""
+    file = request.files.get('file')
+    if not file or not allowed_file(file.filename):
+        return jsonify({'status': 'error', 'message': 'Upload one image as "file"'}), 400
+
+    model_path = resolve_model(request.form.get('model_name', '').strip())
+    if not model_path:
+        return jsonify({'status': 'error', 'message': 'No model available. Add .pt files to model_zoo/.'}), 503
+
+    image = cv2.imdecode(np.frombuffer(file.read(), np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        return jsonify({'status': 'error', 'message': 'Could not decode image'}), 400
+
+    try:
+        model, inference_lock = get_model(model_path)
+        with inference_lock:
+            count, avg_confidence, _ = count_image(model, image, get_inference_params(select_device()))
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Error running YOLO: {str(e)}'}), 500
+
+    return jsonify({
+        'status': 'success',
+        'model': Path(model_path).name,
+        'count': count,
+        'avg_confidence': round(avg_confidence, 3),
+    })
+
+@app.route('/healthz')
+def healthz():
+    """Readiness check: 200 once every available model is warm in this worker"""
+    available_models = get_available_models()
+    models = {Path(m).name: m in _models and _models[m].predictor is not None
+              for m in available_models}
+    ready = bool(models) and all(models.values())
+    body = {'status': 'ready' if ready else 'not_ready', 'pid': os.getpid(), 'models': models}
+    return jsonify(body), 200 if ready else 503
+
 @app.route('/results')
 def show_results():
     """Show results page with download link"""
@@ -240,4 +323,8 @@ def download_file(filename):
 if __name__ == '__main__':
     print("🔬 YOLO Specimen Counter Web Service Starting...")
     print("🌐 Local access: http://localhost:5000 (internal use)")
+    print("⚠️  Development server only - use start_server.sh (gunicorn) for production")
+    # The reloader re-runs this module in a child process; only that one serves
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        preload_models()
     app.run(host='0.0.0.0', port=5000, debug=True)
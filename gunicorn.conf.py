@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for the YOLO Specimen Counter
+All settings can be overridden with environment variables.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# Prefork workers; each handles WEB_THREADS requests at a time. Inference on a
+# model is serialised within a worker, so extra threads mostly cover uploads
+# and page requests while a count is running.
+workers = int(os.environ.get('WEB_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', 4))
+
+# Load the app and warm the models (see wsgi.py) before forking so workers
+# share them.
+# Set PRELOAD_MODELS=0 when serving on GPU: CUDA can't be used across a fork.
+preload_app = os.environ.get('PRELOAD_MODELS', '1') == '1'
+
+# A batch of 10 large drawer images on CPU can take a while
+timeout = int(os.environ.get('WEB_TIMEOUT', 300))
+graceful_timeout = 30
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """Split CPU threads between workers so they don't oversubscribe cores"""
+    import torch
+    torch_threads = os.environ.get('TORCH_THREADS')
+    if torch_threads is None:
+        torch_threads = max(1, multiprocessing.cpu_count() // server.cfg.workers)
+    torch.set_num_threads(int(torch_threads))
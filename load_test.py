@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+YOLO Specimen Counter - Load Test
+Posts an image to /api/count from concurrent clients and reports requests/sec
+and latency percentiles. With --workers it starts gunicorn once per worker
+count so throughput can be compared as the number of workers grows.
+
+Usage:
+    python load_test.py --image drawer.jpg --workers 1 2 4
+    python load_test.py --image drawer.jpg --url http://localhost:5000
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def build_multipart(image_path):
+    """Encode the image as a multipart/form-data body"""
+    boundary = uuid.uuid4().hex
+    data = Path(image_path).read_bytes()
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{Path(image_path).name}"\r\n'
+        'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode() + data + f'\r\n--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def wait_until_ready(url, timeout):
+    """Poll /healthz until the server reports its models are warm"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f'{url}/healthz', timeout=5) as response:
+                if response.status == 200:
+                    return True
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(1)
+    return False
+
+
+def send_request(url, body, content_type):
+    """POST one image; returns (ok, latency in seconds)"""
+    request = urllib.request.Request(
+        f'{url}/api/count', data=body, headers={'Content-Type': content_type}
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=300) as response:
+            response.read()
+            ok = response.status == 200
+    except (urllib.error.URLError, ConnectionError):
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, int(round(pct / 100 * len(ordered))) - 1)
+    return ordered[rank]
+
+
+def run_load(url, body, content_type, requests, concurrency, warmup):
+    """Fire requests from concurrent clients and summarise the results"""
+    # Warm-up so first-call costs (allocator, lazy setup) aren't measured;
+    # sent concurrently so that every worker gets some of them
+    with ThreadPoolExecutor(max_workers=warmup) as pool:
+        list(pool.map(lambda _: send_request(url, body, content_type), range(warmup)))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: send_request(url, body, content_type), range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for ok, latency in results if ok]
+    return {
+        'ok': len(latencies),
+        'failed': len(results) - len(latencies),
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+    }
+
+
+def start_server(workers, threads, port, log_file):
+    """Start gunicorn with the given number of workers, logging to log_file"""
+    env = dict(os.environ, WEB_WORKERS=str(workers), WEB_THREADS=str(threads),
+               BIND=f'127.0.0.1:{port}')
+    return subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+        cwd=Path(__file__).resolve().parent,
+        env=env,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def print_row(label, stats):
+    print(f"{label:>8} | {stats['ok']:>4} ok {stats['failed']:>3} err | "
+          f"{stats['rps']:7.2f} req/s | p50 {stats['p50'] * 1000:8.1f} ms | "
+          f"p95 {stats['p95'] * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the specimen counter web service.")
+    parser.add_argument("--image", required=True, help="Image to post to /api/count")
+    parser.add_argument("--url", default=None,
+                        help="Test an already running server instead of starting gunicorn")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4],
+                        help="Worker counts to start gunicorn with (ignored with --url)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Concurrent clients (default: 2 x workers)")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per run")
+    parser.add_argument("--port", type=int, default=5055, help="Port for started servers")
+    parser.add_argument("--ready-timeout", type=int, default=300,
+                        help="Seconds to wait for /healthz to report ready")
+    args = parser.parse_args()
+
+    body, content_type = build_multipart(args.image)
+
+    print("🔬 YOLO Specimen Counter - Load Test")
+    print("=" * 65)
+
+    if args.url:
+        url = args.url.rstrip('/')
+        if not wait_until_ready(url, args.ready_timeout):
+            print(f"❌ Server not ready: {url}/healthz")
+            sys.exit(1)
+        concurrency = args.concurrency or 4
+        stats = run_load(url, body, content_type, args.requests, concurrency, concurrency)
+        print_row(f"c={concurrency}", stats)
+        return
+
+    url = f'http://127.0.0.1:{args.port}'
+    for workers in args.workers:
+        log_path = Path(tempfile.gettempdir()) / f"load_test_gunicorn_w{workers}.log"
+        with open(log_path, "w") as log_file:
+            server = start_server(workers, args.threads, args.port, log_file)
+            try:
+                if not wait_until_ready(url, args.ready_timeout):
+                    print(f"❌ Server with {workers} worker(s) did not become ready, see {log_path}")
+                    continue
+                concurrency = args.concurrency or 2 * workers
+                stats = run_load(url, body, content_type, args.requests, concurrency,
+                                 workers * args.threads)
+                print_row(f"w={workers}", stats)
+            finally:
+                server.send_signal(signal.SIGTERM)
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
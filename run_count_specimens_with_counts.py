@@ -120,6 +120,108 @@ def save_detection_summary(output_dir, results_data):
                 height
             ])
 
+def select_device():
+    """Use GPU if available, fallback to CPU"""
+    import torch
+    return '0' if torch.cuda.is_available() else 'cpu'
+
+def get_inference_params(device):
+    """Inference parameters shared by the CLI and the web service"""
+    return {
+        'conf': 0.25,          # Confidence threshold
+        'iou': 0.45,           # IoU threshold for NMS
+        'imgsz': 640,          # Inference image size
+        'device': device,      # Smart device selection
+        'verbose': False,      # Reduce output verbosity
+        'max_det': 1000,       # Maximum detections per image (default is 300)
+    }
+
+def find_images(images_dir):
+    """List images in a directory (exclude hidden files and system files)"""
+    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
+    image_files = []
+    for ext in image_extensions:
+        image_files.extend(Path(images_dir).glob(f"*{ext}"))
+        image_files.extend(Path(images_dir).glob(f"*{ext.upper()}"))
+    
+    # Filter out hidden files (starting with . or ._)
+    return [f for f in image_files if not f.name.startswith('.')]
+
+def count_image(model, image, inference_params):
+    """
+    Run the model on a single BGR image.
+    Returns (count, avg_confidence, annotated_image with count banner)
+    """
+    results = model.predict(source=image, **inference_params)
+    result = results[0]  # Single image result
+    
+    # Count detections and calculate confidence
+    if result.boxes is not None and len(result.boxes) > 0:
+        count = len(result.boxes)
+        confidences = result.boxes.conf.cpu().numpy()
+        avg_confidence = float(np.mean(confidences))
+        
+        # Draw detection boxes
+        annotated_image = result.plot(
+            conf=True,              # Show confidence
+            line_width=2,           # Box line width
+            font_size=1,            # Font size for labels
+            pil=False,              # Return as OpenCV format
+        )
+    else:
+        count = 0
+        avg_confidence = 0.0
+        annotated_image = image.copy()
+    
+    # Add count banner
+    final_image = draw_count_banner(annotated_image, count, avg_confidence if count > 0 else None)
+    return count, avg_confidence, final_image
+
+def process_images(model, image_files, output_dir, inference_params):
+    """
+    Count specimens in each image, save annotated copies, summary files
+    and originals under output_dir. Returns the per-image results data.
+    """
+    results_data = []
+    
+    for i, image_path in enumerate(image_files, 1):
+        print(f"   Processing {i}/{len(image_files)}: {image_path.name}")
+        
+        # Load original image
+        image = cv2.imread(str(image_path))
+        if image is None:
+            print(f"      ⚠️  Could not load image: {image_path.name}")
+            continue
+        
+        count, avg_confidence, final_image = count_image(model, image, inference_params)
+        
+        # Save annotated image
+        output_path = output_dir / "annotated_images" / f"counted_{image_path.name}"
+        cv2.imwrite(str(output_path), final_image)
+        
+        # Store results data
+        height, width = image.shape[:2]
+        results_data.append({
+            'filename': image_path.name,
+            'count': count,
+            'avg_confidence': avg_confidence,
+            'image_size': (width, height)
+        })
+        
+        print(f"      ✅ {count} specimens detected (avg conf: {avg_confidence:.1%})")
+    
+    # Save detection summary
+    save_detection_summary(output_dir, results_data)
+    
+    # Copy original images for reference
+    print("\n📋 Copying original images for reference...")
+    originals_dir = output_dir / "original_images"
+    originals_dir.mkdir(exist_ok=True)
+    for image_path in image_files:
+        shutil.copy2(image_path, originals_dir / image_path.name)
+    
+    return results_data
+
 def main():
     parser = argparse.ArgumentParser(description="Run specimen counting with selectable model.")
     parser.add_argument(
@@ -169,36 +271,20 @@ def main():
         sys.exit(1)
     
     # Smart device detection - use GPU if available, fallback to CPU
-    import torch
-    if torch.cuda.is_available():
-        device = '0'
-        print("🚀 Using GPU for inference")
-    else:
-        device = 'cpu'
+    device = select_device()
+    if device == 'cpu':
         print("🖥️  Using CPU for inference (GPU not available)")
+    else:
+        print("🚀 Using GPU for inference")
     
     # Inference parameters
-    inference_params = {
-        'conf': 0.25,          # Confidence threshold
-        'iou': 0.45,           # IoU threshold for NMS
-        'imgsz': 640,          # Inference image size
-        'device': device,      # Smart device selection
-        'verbose': False,      # Reduce output verbosity
-        'max_det': 1000,       # Maximum detections per image (default is 300)
-    }
+    inference_params = get_inference_params(device)
     
     print(f"\n🔍 Processing images...")
     print(f"⏰ Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Get list of images (exclude hidden files and system files)
-    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-    image_files = []
-    for ext in image_extensions:
-        image_files.extend(Path(test_images_dir).glob(f"*{ext}"))
-        image_files.extend(Path(test_images_dir).glob(f"*{ext.upper()}"))
-    
-    # Filter out hidden files (starting with . or ._)
-    image_files = [f for f in image_files if not f.name.startswith('.')]
+    # Get list of images
+    image_files = find_images(test_images_dir)
     
     if not image_files:
         print(f"❌ No images found in {test_images_dir}")
@@ -206,70 +292,9 @@ def main():
     
     print(f"📸 Found {len(image_files)} images to process")
     
-    results_data = []
-    total_specimens = 0
-    
     try:
-        for i, image_path in enumerate(image_files, 1):
-            print(f"   Processing {i}/{len(image_files)}: {image_path.name}")
-            
-            # Run inference on single image
-            results = model.predict(source=str(image_path), **inference_params)
-            
-            # Load original image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                print(f"      ⚠️  Could not load image: {image_path.name}")
-                continue
-            
-            result = results[0]  # Single image result
-            
-            # Count detections and calculate confidence
-            if result.boxes is not None and len(result.boxes) > 0:
-                count = len(result.boxes)
-                confidences = result.boxes.conf.cpu().numpy()
-                avg_confidence = np.mean(confidences)
-                
-                # Draw detection boxes
-                annotated_image = result.plot(
-                    conf=True,              # Show confidence
-                    line_width=2,           # Box line width
-                    font_size=1,            # Font size for labels
-                    pil=False,              # Return as OpenCV format
-                )
-            else:
-                count = 0
-                avg_confidence = 0.0
-                annotated_image = image.copy()
-            
-            # Add count banner
-            final_image = draw_count_banner(annotated_image, count, avg_confidence if count > 0 else None)
-            
-            # Save annotated image
-            output_path = output_dir / "annotated_images" / f"counted_{image_path.name}"
-            cv2.imwrite(str(output_path), final_image)
-            
-            # Store results data
-            height, width = image.shape[:2]
-            results_data.append({
-                'filename': image_path.name,
-                'count': count,
-                'avg_confidence': avg_confidence,
-                'image_size': (width, height)
-            })
-            
-            total_specimens += count
-            print(f"      ✅ {count} specimens detected (avg conf: {avg_confidence:.1%})")
-        
-        # Save detection summary
-        save_detection_summary(output_dir, results_data)
-        
-        # Copy original images for reference
-        print("\n📋 Copying original images for reference...")
-        originals_dir = output_dir / "original_images"
-        originals_dir.mkdir(exist_ok=True)
-        for image_path in image_files:
-            shutil.copy2(image_path, originals_dir / image_path.name)
+        results_data = process_images(model, image_files, output_dir, inference_params)
+        total_specimens = sum(r['count'] for r in results_data)
         
         print("✅ Processing completed successfully!")
         
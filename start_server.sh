@@ -7,11 +7,17 @@ echo "================================================"
 # Navigate to the yolo directory
 cd /home/appuser/yolo
 
-echo "📡 Starting Flask server on port 5000 (internal access)..."
+# Serving settings (see gunicorn.conf.py)
+export WEB_WORKERS=${WEB_WORKERS:-2}
+export WEB_THREADS=${WEB_THREADS:-4}
+export PRELOAD_MODELS=${PRELOAD_MODELS:-1}
+
+echo "📡 Starting gunicorn on port 5000 ($WEB_WORKERS workers x $WEB_THREADS threads)..."
 echo "🌐 Local access: http://localhost:5000"
+echo "❤️  Readiness: http://localhost:5000/healthz"
 echo ""
 echo "Press Ctrl+C to stop the server"
 echo "================================================"
 
-# Start the Flask app
-/usr/local/bin/python app.py
+# Start the app under gunicorn
+exec /usr/local/bin/python -m gunicorn -c gunicorn.conf.py wsgi:app
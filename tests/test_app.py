@@ -0,0 +1,102 @@
+"""
+Smoke tests for the web service routes, with the YOLO model stubbed out.
+
+Usage: python -m pytest tests
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+class FakeResult:
+    boxes = None
+
+
+class FakeModel:
+    """Stands in for ultralytics.YOLO; detects nothing"""
+
+    def __init__(self, model_path=None):
+        self.calls = 0
+        self.predictor = None
+
+    def predict(self, source, **kwargs):
+        self.calls += 1
+        self.predictor = object()  # set up on first predict, as in ultralytics
+        return [FakeResult()]
+
+
+@pytest.fixture
+def web(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    import app as web_app
+
+    zoo = tmp_path / "model_zoo"
+    zoo.mkdir()
+    (zoo / "best.pt").write_bytes(b"")
+    upload_dir = tmp_path / "uploads"
+    upload_dir.mkdir()
+
+    monkeypatch.setattr(web_app, "MODEL_ZOO_DIR", zoo)
+    monkeypatch.setattr(web_app, "UPLOAD_FOLDER", str(upload_dir))
+    monkeypatch.setattr(web_app, "RESULTS_FOLDER", str(tmp_path / "results"))
+    monkeypatch.setattr(web_app, "YOLO", FakeModel)
+    monkeypatch.setattr(web_app, "_models", {})
+    monkeypatch.setattr(web_app, "_inference_locks", {})
+    web_app.app.config["TESTING"] = True
+    return web_app
+
+
+def test_run_yolo_counts_uploads_in_process(web, tmp_path):
+    cv2.imwrite(str(tmp_path / "uploads" / "drawer.jpg"), np.zeros((64, 64, 3), np.uint8))
+
+    response = web.app.test_client().get("/run_yolo")
+
+    assert response.get_json() == {"status": "success", "message": "Processing completed"}
+    model, _ = web.get_model(web.get_available_models()[0])
+    assert model.calls == 1
+    summary = list((tmp_path / "results").glob("specimen_counts_*/summary/detection_summary.txt"))
+    assert len(summary) == 1
+    assert "Total Specimens Detected: 0" in summary[0].read_text()
+
+
+def test_healthz_ready_once_models_warm(web):
+    client = web.app.test_client()
+
+    response = client.get("/healthz")
+    assert response.status_code == 503
+    assert response.get_json()["models"] == {"best.pt": False}
+
+    # Loaded but not yet run: the predictor isn't set up, so not warm
+    model, _ = web.get_model(web.get_available_models()[0])
+    assert client.get("/healthz").status_code == 503
+
+    web.preload_models()
+    assert model.calls == 1
+
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ready"
+
+
+def test_api_count_returns_json_error_when_model_fails(web, monkeypatch):
+    def broken_model(model_path):
+        raise RuntimeError("corrupt weights")
+
+    monkeypatch.setattr(web, "YOLO", broken_model)
+    _, encoded = cv2.imencode(".jpg", np.zeros((64, 64, 3), np.uint8))
+
+    response = web.app.test_client().post(
+        "/api/count", data={"file": (io.BytesIO(encoded.tobytes()), "drawer.jpg")},
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 500
+    assert response.get_json()["status"] == "error"
+    assert "corrupt weights" in response.get_json()["message"]
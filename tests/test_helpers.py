@@ -0,0 +1,35 @@
+"""
+Tests for the counting and load-test helpers.
+
+Usage: python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from load_test import percentile
+from run_count_specimens_with_counts import find_images, get_inference_params
+
+
+def test_find_images_skips_hidden_and_non_images(tmp_path):
+    for name in ["a.jpg", "b.PNG", "._a.jpg", ".hidden.png", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+
+    assert sorted(f.name for f in find_images(tmp_path)) == ["a.jpg", "b.PNG"]
+
+
+def test_get_inference_params_uses_device():
+    params = get_inference_params('cpu')
+
+    assert params['device'] == 'cpu'
+    assert params['max_det'] == 1000
+
+
+def test_percentile_nearest_rank():
+    latencies = [float(i) for i in range(1, 21)]
+
+    assert percentile(latencies, 50) == 10.0
+    assert percentile(latencies, 95) == 19.0
+    assert percentile([], 95) == 0.0
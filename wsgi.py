@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for production serving
+Models are loaded and warmed at import. With gunicorn's preload_app
+(PRELOAD_MODELS=1) that happens once in the master process, so the forked
+workers share the warmed predictors' weights copy-on-write; otherwise each
+worker loads and warms its own copy.
+
+Usage: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import gc
+import os
+
+from app import app, preload_models
+
+loaded = preload_models()
+print(f"✅ Warmed {len(loaded)} model(s) in process {os.getpid()}")
+
+# Move the loaded objects out of the collector's reach so that gc passes in
+# the workers don't write to (and un-share) the pages holding them
+gc.freeze()